@@ -4,18 +4,34 @@ Network Scanner - Detect devices and web services on local network
 Cross-platform support for Windows, Linux, and macOS
 """
 
+import ctypes
+import errno
+import os
 import subprocess
 import platform
+import select
+import selectors
 import socket
+import struct
 import re
 import ipaddress
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from array import array
+from bisect import bisect_left
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import Callable, List, Dict, Tuple, Optional
 import time
 import sys
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # MAC vendor OUI database (first 3 bytes of MAC address)
 MAC_VENDORS = {
     '00:0C:29': 'VMware',
@@ -39,7 +55,6 @@ MAC_VENDORS = {
     '00:16:CB': 'Apple',
     '00:17:F2': 'Apple',
     '00:19:E3': 'Apple',
-    '00:1B:63': 'Apple',
     '00:1C:B3': 'Apple',
     '00:1D:4F': 'Apple',
     '00:1E:52': 'Apple',
@@ -491,7 +506,6 @@ MAC_VENDORS = {
     '20:F4:1B': 'TP-Link',
     '24:A4:3C': 'TP-Link',
     '28:2C:B2': 'TP-Link',
-    '2C:30:33': 'TP-Link',
     '30:B5:C2': 'TP-Link',
     '38:D5:47': 'TP-Link',
     '44:32:C8': 'TP-Link',
@@ -505,7 +519,6 @@ MAC_VENDORS = {
     '74:DA:88': 'TP-Link',
     '7C:8B:CA': 'TP-Link',
     '84:16:F9': 'TP-Link',
-    '88:D7:F6': 'TP-Link',
     '8C:A6:DF': 'TP-Link',
     '90:F6:52': 'TP-Link',
     '98:25:4A': 'TP-Link',
@@ -542,7 +555,6 @@ MAC_VENDORS = {
     '00:23:69': 'Linksys',
     '00:25:9C': 'Linksys',
     '08:86:3B': 'Linksys',
-    '10:BF:48': 'Linksys',
     '14:91:82': 'Linksys',
     '20:AA:4B': 'Linksys',
     '30:23:03': 'Linksys',
@@ -593,7 +605,6 @@ MAC_VENDORS = {
     'F8:32:E4': 'Asus',
     '00:09:5B': 'Synology',
     '00:11:32': 'Synology',
-    '00:11:32': 'Synology',
     '28:39:5E': 'Google',
     '3C:5A:B4': 'Google',
     '54:60:09': 'Google',
@@ -625,7 +636,6 @@ MAC_VENDORS = {
     '54:E0:32': 'Broadcom',
     '84:EB:18': 'Broadcom',
     'B8:AE:ED': 'Broadcom',
-    'BC:EE:7B': 'Broadcom',
     'F8:1A:67': 'Broadcom',
     '00:11:D9': 'Samsung',
     '00:12:47': 'Samsung',
@@ -839,15 +849,231 @@ MAC_VENDORS = {
 }
 
 
+@lru_cache(maxsize=1)
+def _oui_table() -> Tuple[array, array, Tuple[str, ...]]:
+    """Pack MAC_VENDORS into sorted OUI integers, vendor ids and a vendor name table (built on first use)"""
+    names = tuple(sorted(set(MAC_VENDORS.values())))
+    vendor_ids = {name: i for i, name in enumerate(names)}
+    entries = sorted((int(oui.replace(':', ''), 16), vendor_ids[vendor]) for oui, vendor in MAC_VENDORS.items())
+    keys = array('I', [oui for oui, _ in entries])
+    ids = array('H', [vendor_id for _, vendor_id in entries])
+    return keys, ids, names
+
+
+def _lookup_oui(oui: int) -> str:
+    """Vendor name for a 24-bit OUI"""
+    keys, ids, names = _oui_table()
+    i = bisect_left(keys, oui)
+    if i < len(keys) and keys[i] == oui:
+        return names[ids[i]]
+    return "Unknown"
+
+
+# Anything that is not a hex digit, stripped when normalizing MAC addresses
+_MAC_CLEAN = re.compile(rb'[^0-9a-fA-F]')
+
+
+def _norm_mac(mac: str) -> Optional[bytes]:
+    """Pack a MAC address in any separator style into 6 bytes, None if it is not a MAC"""
+    digits = _MAC_CLEAN.sub(b'', mac.encode('ascii', 'ignore'))
+    if len(digits) != 12:
+        return None
+    return bytes.fromhex(digits.decode('ascii'))
+
+
+def _format_mac(mac: bytes) -> str:
+    """Format a packed MAC address as AA:BB:CC:DD:EE:FF for display"""
+    return ':'.join(f'{octet:02X}' for octet in mac)
+
+
+# Packed broadcast MAC and the OUI used for IPv4 multicast MACs
+_BROADCAST_MAC = b'\xff' * 6
+_IPV4_MULTICAST_OUI = b'\x01\x00\x5e'
+
+
+# ARP table line patterns, matched over the raw `arp -a` output
+_ARP_WIN = re.compile(rb'(\d+\.\d+\.\d+\.\d+)[ \t]+([0-9a-fA-F-]{17})')
+_ARP_UNIX = re.compile(rb'\((\d+\.\d+\.\d+\.\d+)\)[ \t]+at[ \t]+([0-9a-fA-F:]{17})')
+
+# A single MAC address in either aa:bb:cc:dd:ee:ff or aa-bb-cc-dd-ee-ff form
+_MAC_RE = re.compile(rb'[0-9a-fA-F]{2}(?:[:-][0-9a-fA-F]{2}){5}')
+
+# Page title, bounded so malformed HTML cannot make the match run across the whole body
+_TITLE_RE = re.compile(rb'<title[^>]*>\s*([^<]{0,256})', re.IGNORECASE)
+_TITLE_END_RE = re.compile(rb'</title', re.IGNORECASE)
+
+# Most bytes of a page body read while looking for its title
+TITLE_SCAN_BYTES = 16384
+
+# Common web ports probed on every device, with the scheme(s) to try on each
+PORT_SCHEMES = {
+    80: ('http',),
+    443: ('https',),
+    8080: ('http',),
+    8000: ('http',),
+    8443: ('https',),
+    8888: ('http', 'https'),
+    3000: ('http',),
+    5000: ('http',),
+    9090: ('http',),
+}
+WEB_PORTS = list(PORT_SCHEMES)
+
+# TCP connect pre-check timeout in seconds, closed ports answer with RST well before this
+CONNECT_TIMEOUT = 0.3
+
+# Most TCP connects kept in flight at once, lowered further by _connect_batch_limit() on small fd limits
+CONNECT_BATCH = 256
+
+# connect_ex() results meaning a non-blocking connect is under way (WSAEWOULDBLOCK on Windows)
+_CONNECT_IN_PROGRESS = {
+    errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY,
+    getattr(errno, 'WSAEWOULDBLOCK', errno.EWOULDBLOCK)
+}
+
+# HTTP (connect, read) timeouts in seconds, the port is already known to be open
+HTTP_TIMEOUT = (1.0, 2.0)
+
+# Report separator lines
+_EQ = "=" * 80
+_DASH = "-" * 80
+
+# Minimum seconds between progress line updates
+PROGRESS_INTERVAL = 0.05
+
+# ICMP sweep pacing: echo requests per burst, and the pause (seconds) spent reading replies after each
+SWEEP_BURST = 64
+SWEEP_PAUSE = 0.001
+
+# ICMP message types used by the ping sweep
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Compute the RFC 1071 one's-complement checksum of an ICMP message"""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+_iphlpapi = None
+
+
+def _windows_icmp_echo(ip: str, timeout_ms: int = 1000) -> Optional[bool]:
+    """Send one echo request via IcmpSendEcho (Windows), returns None if the API is unavailable"""
+    global _iphlpapi
+    try:
+        if _iphlpapi is None:
+            dll = ctypes.windll.iphlpapi
+            dll.IcmpCreateFile.restype = ctypes.c_void_p
+            dll.IcmpCloseHandle.argtypes = [ctypes.c_void_p]
+            dll.IcmpSendEcho.argtypes = [
+                ctypes.c_void_p, ctypes.c_ulong, ctypes.c_char_p, ctypes.c_ushort,
+                ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong
+            ]
+            dll.IcmpSendEcho.restype = ctypes.c_ulong
+            _iphlpapi = dll
+        
+        handle = _iphlpapi.IcmpCreateFile()
+        if not handle or handle == ctypes.c_void_p(-1).value:
+            return None
+        try:
+            payload = b'netscan'
+            # IPAddr is the address in network byte order, read as a native ULONG
+            address = struct.unpack('=L', socket.inet_aton(ip))[0]
+            reply = ctypes.create_string_buffer(256)
+            count = _iphlpapi.IcmpSendEcho(handle, address, payload, len(payload),
+                                           None, reply, len(reply), timeout_ms)
+            # ICMP_ECHO_REPLY.Status follows the 4-byte Address field, 0 means success
+            return count > 0 and struct.unpack_from('=L', reply.raw, 4)[0] == 0
+        finally:
+            _iphlpapi.IcmpCloseHandle(handle)
+    except (AttributeError, OSError):
+        return None
+
+
+def _is_privileged() -> bool:
+    """Check for root (POSIX) or Administrator (Windows) rights, needed to send raw frames"""
+    if hasattr(os, 'geteuid'):
+        return os.geteuid() == 0
+    try:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except (AttributeError, OSError):
+        return False
+
+
+def _connect_batch_limit() -> int:
+    """In-flight connect cap, a quarter of the soft fd limit (HTTP probes need descriptors too) up to CONNECT_BATCH"""
+    if resource is None:
+        return CONNECT_BATCH
+    try:
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (OSError, ValueError):
+        return CONNECT_BATCH
+    if soft == resource.RLIM_INFINITY:
+        return CONNECT_BATCH
+    return max(1, min(CONNECT_BATCH, soft // 4))
+
+
 class NetworkScanner:
     """Cross-platform network scanner with web service detection"""
     
     def __init__(self):
         self.os_type = platform.system()
-        self.devices = []
+        # Devices are stored column-wise, index i across every list is one device
+        self._ip_ints = array('I')
+        self._ips = []
+        self._macs = []  # packed 6-byte MAC addresses
+        self._vendors = []
+        self._web = []
+        self._with_web = 0  # devices with at least one web service, set by scan()
+        self._alive = {}  # ip -> ping result, shared by every stage of a scan
+        self._mac_cache = {}  # ip -> MAC from individual lookups, None when unresolved
+        self._arp_snapshot = {}  # ip -> MAC from the ARP cache, read after the sweep
+        self._progress_tty = sys.stdout.isatty()
+        self._last_progress = 0.0
         self.local_ip = self._get_local_ip()
         self.network_range = self._get_network_range()
+        self.session = self._create_session()
+        # One worker pool shared by every stage, no per-stage pool setup/teardown
+        self.executor = ThreadPoolExecutor(max_workers=200)
+        
+    def _create_session(self) -> requests.Session:
+        """Create the shared HTTP session so probes reuse pooled connections"""
+        # Disable SSL warnings (device web UIs mostly use self-signed certs)
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         
+        session = requests.Session()
+        # Pools are per (scheme, host, port): keep one for every probed service,
+        # each only needs a couple of connections for the HEAD and GET
+        adapter = HTTPAdapter(pool_connections=256, pool_maxsize=4, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+    
+    @property
+    def devices(self) -> List[Dict]:
+        """Per-device dict view of the scan results"""
+        return [
+            {'ip': ip, 'mac': _format_mac(mac), 'vendor': vendor, 'web_services': web_services}
+            for ip, mac, vendor, web_services in zip(self._ips, self._macs, self._vendors, self._web)
+        ]
+    
+    def _show_progress(self, completed: int, total: int, what: str):
+        """Update the progress line, throttled by time and skipped when stdout is not a terminal"""
+        if not self._progress_tty:
+            return
+        now = time.monotonic()
+        if completed == total or now - self._last_progress >= PROGRESS_INTERVAL:
+            sys.stdout.write(f"\r[*] Progress: {completed}/{total} {what}")
+            sys.stdout.flush()
+            self._last_progress = now
+    
     def _get_local_ip(self) -> str:
         """Get the local IP address of this machine"""
         try:
@@ -870,44 +1096,91 @@ class NetworkScanner:
         except Exception:
             return "192.168.1.0/24"
     
+    def _read_proc_arp(self) -> Optional[List[Dict[str, str]]]:
+        """Read the Linux kernel ARP table directly, returns None where /proc/net/arp is unavailable"""
+        try:
+            with open('/proc/net/arp') as f:
+                lines = f.read().splitlines()[1:]
+        except OSError:
+            return None
+        
+        devices = []
+        for line in lines:
+            fields = line.split()
+            # Columns: IP address, HW type, Flags, HW address, Mask, Device
+            if len(fields) >= 4 and fields[3] != '00:00:00:00:00:00':
+                devices.append({'ip': fields[0], 'mac': fields[3]})
+        return devices
+    
     def _parse_arp_table(self) -> List[Dict[str, str]]:
         """Parse the system ARP table to get IP-MAC mappings"""
+        if self.os_type == "Linux":
+            devices = self._read_proc_arp()
+            if devices is not None:
+                return devices
+        
         devices = []
         
         try:
+            result = subprocess.run(['arp', '-a'], capture_output=True, timeout=10)
+            output = result.stdout
+            
             if self.os_type == "Windows":
-                result = subprocess.run(['arp', '-a'], capture_output=True, text=True, timeout=10)
-                output = result.stdout
-                
                 # Parse Windows ARP output
-                for line in output.split('\n'):
-                    # Look for lines with IP and MAC
-                    match = re.search(r'(\d+\.\d+\.\d+\.\d+)\s+([0-9a-f-]{17})', line, re.IGNORECASE)
-                    if match:
-                        ip = match.group(1)
-                        mac = match.group(2).upper().replace('-', ':')
-                        devices.append({'ip': ip, 'mac': mac})
+                for match in _ARP_WIN.finditer(output):
+                    ip = match.group(1).decode()
+                    mac = match.group(2).decode()
+                    devices.append({'ip': ip, 'mac': mac})
             
             else:  # Linux/macOS
-                result = subprocess.run(['arp', '-a'], capture_output=True, text=True, timeout=10)
-                output = result.stdout
-                
-                # Parse Unix-like ARP output
-                for line in output.split('\n'):
-                    # Look for patterns like: hostname (192.168.1.1) at aa:bb:cc:dd:ee:ff
-                    match = re.search(r'\((\d+\.\d+\.\d+\.\d+)\)\s+at\s+([0-9a-f:]{17})', line, re.IGNORECASE)
-                    if match:
-                        ip = match.group(1)
-                        mac = match.group(2).upper()
-                        devices.append({'ip': ip, 'mac': mac})
+                # Look for patterns like: hostname (192.168.1.1) at aa:bb:cc:dd:ee:ff
+                for match in _ARP_UNIX.finditer(output):
+                    ip = match.group(1).decode()
+                    mac = match.group(2).decode()
+                    devices.append({'ip': ip, 'mac': mac})
         
         except Exception as e:
             print(f"Warning: Could not parse ARP table: {e}")
         
         return devices
     
+    def _arp_sweep(self) -> Optional[List[Dict[str, str]]]:
+        """Discover hosts and their MACs with one ARP broadcast (needs scapy and raw socket privileges)"""
+        # Importing scapy alone takes seconds, so skip it when srp() is bound to fail
+        if not _is_privileged():
+            return None
+        
+        try:
+            from scapy.all import ARP, Ether, srp
+        except ImportError:
+            return None
+        
+        try:
+            answered, _ = srp(
+                Ether(dst='ff:ff:ff:ff:ff:ff') / ARP(pdst=self.network_range),
+                timeout=2,
+                verbose=0
+            )
+        except Exception:
+            # Typically no pcap driver or no usable interface
+            return None
+        
+        return [{'ip': reply.psrc, 'mac': reply.hwsrc} for _, reply in answered]
+    
     def _ping_host(self, ip: str) -> bool:
-        """Ping a single host to check if it's alive"""
+        """Ping a single host to check if it's alive, reusing earlier results"""
+        if ip not in self._alive:
+            self._alive[ip] = self._send_ping(ip)
+        return self._alive[ip]
+    
+    def _send_ping(self, ip: str) -> bool:
+        """Send one echo request to a host"""
+        if self.os_type == "Windows":
+            # IcmpSendEcho avoids spawning a ping process per host
+            alive = _windows_icmp_echo(ip)
+            if alive is not None:
+                return alive
+        
         try:
             if self.os_type == "Windows":
                 result = subprocess.run(
@@ -925,241 +1198,486 @@ class NetworkScanner:
         except Exception:
             return False
     
+    def _read_arp_table_once(self) -> Dict[str, str]:
+        """Snapshot the kernel ARP cache as an ip -> MAC map (one file read or one `arp -a` run)"""
+        return {device['ip']: device['mac'] for device in self._parse_arp_table()}
+    
     def _get_mac_from_ip(self, ip: str) -> Optional[str]:
         """Get MAC address for a specific IP from ARP table"""
         try:
-            # Ping first to populate ARP table
-            self._ping_host(ip)
-            time.sleep(0.1)
+            # Ping first to populate ARP table, unless the sweep already did
+            if ip not in self._alive:
+                self._ping_host(ip)
             
             if self.os_type == "Windows":
-                result = subprocess.run(['arp', '-a', ip], capture_output=True, text=True, timeout=5)
-                output = result.stdout
-                match = re.search(r'([0-9a-f-]{17})', output, re.IGNORECASE)
-                if match:
-                    return match.group(1).upper().replace('-', ':')
+                result = subprocess.run(['arp', '-a', ip], capture_output=True, timeout=5)
             else:  # Linux/macOS
-                result = subprocess.run(['arp', '-n', ip], capture_output=True, text=True, timeout=5)
-                output = result.stdout
-                match = re.search(r'([0-9a-f:]{17})', output, re.IGNORECASE)
-                if match:
-                    return match.group(1).upper()
+                result = subprocess.run(['arp', '-n', ip], capture_output=True, timeout=5)
+            
+            match = _MAC_RE.search(result.stdout)
+            if match:
+                return match.group(0).decode()
         except Exception:
             pass
         return None
     
-    def _identify_vendor(self, mac: str) -> str:
-        """Identify device vendor from MAC address OUI"""
-        if not mac or len(mac) < 8:
-            return "Unknown"
+    def _open_icmp_socket(self) -> Optional[socket.socket]:
+        """Open one ICMP socket for the sweep (raw, or unprivileged datagram on Linux/macOS)"""
+        for sock_type in (socket.SOCK_RAW, socket.SOCK_DGRAM):
+            try:
+                return socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+            except (OSError, AttributeError):
+                continue
+        return None
+    
+    def _icmp_sweep(self, hosts: List[str], timeout: float = 1.0) -> Optional[List[str]]:
+        """Ping all hosts through a single ICMP socket, returns None if no ICMP socket is available"""
+        sock = self._open_icmp_socket()
+        if sock is None:
+            return None
+        
+        ident = os.getpid() & 0xFFFF
+        # Datagram ICMP sockets get their identifier rewritten and filtered by the kernel
+        check_ident = sock.type == socket.SOCK_RAW
+        payload = b'netscan'
+        seq_to_ip = {}
+        alive = set()
+        
+        def drain(wait: float):
+            """Read queued replies, waiting up to `wait` seconds for the first one"""
+            while len(alive) < len(seq_to_ip):
+                ready, _, _ = select.select([sock], [], [], wait)
+                if not ready:
+                    return
+                wait = 0
+                try:
+                    data, addr = sock.recvfrom(1024)
+                except OSError:
+                    continue
+                
+                # Raw sockets (and datagram sockets on macOS) include the IP header
+                if data and data[0] >> 4 == 4:
+                    data = data[(data[0] & 0x0F) * 4:]
+                if len(data) < 8:
+                    continue
+                
+                icmp_type, _, _, reply_ident, reply_seq = struct.unpack('!BBHHH', data[:8])
+                if icmp_type != ICMP_ECHO_REPLY:
+                    continue
+                if check_ident and reply_ident != ident:
+                    continue
+                # Match the reply to the request it answers by sequence number
+                if seq_to_ip.get(reply_seq) == addr[0]:
+                    alive.add(addr[0])
+        
+        try:
+            # Send every echo request on the same socket, draining replies between
+            # bursts so large ranges neither overflow the send buffer nor the receive queue
+            for seq, ip in enumerate(hosts):
+                seq &= 0xFFFF
+                header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+                checksum = _icmp_checksum(header + payload)
+                packet = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + payload
+                try:
+                    sock.sendto(packet, (ip, 0))
+                except OSError:
+                    continue
+                seq_to_ip[seq] = ip
+                if len(seq_to_ip) % SWEEP_BURST == 0:
+                    drain(SWEEP_PAUSE)
+            
+            # Collect the remaining replies until everyone answered or the deadline passes
+            deadline = time.monotonic() + timeout
+            while len(alive) < len(seq_to_ip):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                drain(remaining)
+        finally:
+            sock.close()
+        
+        return [ip for ip in hosts if ip in alive]
+    
+    def _fping_sweep(self, hosts: List[str]) -> Optional[List[str]]:
+        """Ping the whole range with one fping process, returns None if fping is unavailable"""
+        try:
+            result = subprocess.run(
+                ['fping', '-a', '-q', '-r', '1', '-g', self.network_range],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
         
-        # Extract OUI (first 3 octets)
-        oui = ':'.join(mac.split(':')[:3])
+        # Exit status 1 only means some hosts were unreachable
+        if result.returncode not in (0, 1):
+            return None
         
-        # Check against known vendors
-        vendor = MAC_VENDORS.get(oui, "Unknown")
-        return vendor
+        alive = set(result.stdout.split())
+        return [ip for ip in hosts if ip in alive]
+    
+    def _identify_all(self, macs: List[bytes]) -> List[str]:
+        """Identify the vendor for each packed MAC address, in order"""
+        return [_lookup_oui(int.from_bytes(mac[:3], 'big')) for mac in macs]
     
     def _scan_network_range(self) -> List[str]:
         """Scan network range using ping sweep"""
         print(f"\n[*] Scanning network range: {self.network_range}")
         
-        alive_hosts = []
         network = ipaddress.ip_network(self.network_range, strict=False)
         
-        # Use ThreadPoolExecutor for parallel pinging
-        with ThreadPoolExecutor(max_workers=50) as executor:
-            futures = {}
-            for ip in network.hosts():
-                ip_str = str(ip)
-                futures[executor.submit(self._ping_host, ip_str)] = ip_str
-            
-            # Progress counter
-            total = len(futures)
-            completed = 0
+        # Walk the host range as integers instead of allocating IPv4Address objects
+        first = int(network.network_address)
+        last = int(network.broadcast_address)
+        if network.prefixlen < 31:
+            # Skip the network and broadcast addresses, like network.hosts()
+            first += 1
+            last -= 1
+        hosts = [socket.inet_ntoa(i.to_bytes(4, 'big')) for i in range(first, last + 1)]
+        
+        # Fast path: one ICMP socket multiplexes every probe, no ping processes.
+        # Without ICMP socket access, a single fping run still avoids per-host pings
+        alive_hosts = self._icmp_sweep(hosts)
+        if alive_hosts is None:
+            alive_hosts = self._fping_sweep(hosts)
+        if alive_hosts is not None:
+            alive_set = set(alive_hosts)
+            for ip in hosts:
+                self._alive[ip] = ip in alive_set
+            print(f"[+] Found {len(alive_hosts)} alive hosts")
+            return alive_hosts
+        
+        # Fall back to one ping command per host
+        alive_hosts = []
+        
+        # Ping in parallel on the shared executor
+        futures = {}
+        for ip_str in hosts:
+            futures[self.executor.submit(self._ping_host, ip_str)] = ip_str
+        
+        # Progress counter
+        total = len(futures)
+        completed = 0
+        
+        for future in as_completed(futures):
+            completed += 1
+            ip = futures[future]
+            self._show_progress(completed, total, "hosts checked")
             
-            for future in as_completed(futures):
-                completed += 1
-                ip = futures[future]
-                if completed % 10 == 0 or completed == total:
-                    print(f"\r[*] Progress: {completed}/{total} hosts checked", end='', flush=True)
-                
-                try:
-                    if future.result():
-                        alive_hosts.append(ip)
-                except Exception:
-                    pass
+            try:
+                if future.result():
+                    alive_hosts.append(ip)
+            except Exception:
+                pass
         
         print(f"\n[+] Found {len(alive_hosts)} alive hosts")
         return alive_hosts
     
-    def _check_web_service(self, ip: str, port: int) -> Optional[Dict[str, str]]:
-        """Check if a web service is running on the given port"""
-        protocols = ['http', 'https'] if port == 443 else ['http']
+    def _tcp_connect_scan(self, targets: List[Tuple[str, int]], on_open: Callable[[str, int], None],
+                          timeout: float = CONNECT_TIMEOUT):
+        """Non-blocking TCP connect to every (ip, port) from one thread, calling on_open for each open port"""
+        sel = selectors.DefaultSelector()
+        pending = iter(targets)
+        deferred = None
+        exhausted = False
+        limit = _connect_batch_limit()
+        completed = 0
+        total = len(targets)
         
-        for protocol in protocols:
-            url = f"{protocol}://{ip}:{port}"
-            try:
-                response = requests.get(
-                    url,
-                    timeout=3,
-                    verify=False,  # Ignore SSL certificate errors
-                    allow_redirects=True
-                )
+        def finish(sock: Optional[socket.socket], target: Tuple[str, int], is_open: bool):
+            nonlocal completed
+            if sock is not None:
+                sel.unregister(sock)
+                sock.close()
+            completed += 1
+            self._show_progress(completed, total, "ports checked for web services")
+            if is_open:
+                on_open(*target)
+        
+        try:
+            while True:
+                # Keep up to limit connects in flight
+                while not exhausted and len(sel.get_map()) < limit:
+                    target = deferred or next(pending, None)
+                    deferred = None
+                    if target is None:
+                        exhausted = True
+                        break
+                    sock = None
+                    try:
+                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                        sock.setblocking(False)
+                        err = sock.connect_ex(target)
+                    except OSError:
+                        # Typically out of file descriptors, back off until in-flight connects drain
+                        if sock is not None:
+                            sock.close()
+                        if sel.get_map():
+                            deferred = target
+                            limit = len(sel.get_map())
+                            break
+                        # Nothing in flight to wait for, count the port as closed rather than spin
+                        finish(None, target, False)
+                        continue
+                    if err in _CONNECT_IN_PROGRESS:
+                        sel.register(sock, selectors.EVENT_WRITE, (target, time.monotonic() + timeout))
+                    else:
+                        sock.close()
+                        finish(None, target, err == 0)
                 
-                # Extract page title
-                title = "No Title"
-                if response.text:
-                    title_match = re.search(r'<title>(.*?)</title>', response.text, re.IGNORECASE | re.DOTALL)
-                    if title_match:
-                        title = title_match.group(1).strip()
-                        # Clean up whitespace and limit length
-                        title = ' '.join(title.split())[:100]
-                        # Replace problematic characters
-                        title = title.encode('ascii', 'ignore').decode('ascii')
-                        if not title:
-                            title = "No Title"
+                keys = list(sel.get_map().values())
+                if not keys:
+                    break
                 
-                # Get server header
-                server = response.headers.get('Server', 'Unknown')
+                # Writable means the handshake finished, SO_ERROR tells whether it succeeded
+                next_deadline = min(key.data[1] for key in keys)
+                for key, _ in sel.select(max(0.0, next_deadline - time.monotonic())):
+                    sock = key.fileobj
+                    finish(sock, key.data[0], sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0)
                 
-                return {
-                    'url': url,
-                    'status': response.status_code,
-                    'server': server,
-                    'title': title
-                }
-            
+                # Filtered ports never answer, drop them once their deadline passes
+                now = time.monotonic()
+                for key in list(sel.get_map().values()):
+                    if key.data[1] <= now:
+                        finish(key.fileobj, key.data[0], False)
+        finally:
+            for key in list(sel.get_map().values()):
+                sel.unregister(key.fileobj)
+                key.fileobj.close()
+            sel.close()
+    
+    def _fetch_page(self, url: str) -> Tuple[requests.Response, str]:
+        """GET a page and extract its title from the first few KB of the body"""
+        response = self.session.get(
+            url,
+            timeout=HTTP_TIMEOUT,
+            verify=False,  # Ignore SSL certificate errors
+            allow_redirects=True,
+            stream=True
+        )
+        
+        # Only read the start of the page, stopping once the title has arrived
+        body = bytearray()
+        try:
+            for chunk in response.iter_content(4096):
+                # Only rescan the new bytes (plus enough overlap for a split closing tag)
+                start = max(0, len(body) - 7)
+                body += chunk
+                if _TITLE_END_RE.search(body, start) or len(body) >= TITLE_SCAN_BYTES:
+                    break
+        finally:
+            response.close()
+        del body[TITLE_SCAN_BYTES:]
+        
+        # Extract page title
+        title = "No Title"
+        if body:
+            title_match = _TITLE_RE.search(body)
+            if title_match:
+                title = title_match.group(1).decode('utf-8', errors='replace').strip()
+                # Clean up whitespace and limit length
+                title = ' '.join(title.split())[:100]
+                # Replace problematic characters
+                title = title.encode('ascii', 'ignore').decode('ascii')
+                if not title:
+                    title = "No Title"
+        
+        return response, title
+    
+    def _check_web_service(self, ip: str, port: int) -> Optional[Dict[str, str]]:
+        """Check if a web service is running on an open port"""
+        for protocol in PORT_SCHEMES.get(port, ('http',)):
+            url = f"{protocol}://{ip}:{port}"
+            try:
+                # HEAD first, the body is only downloaded when there is a page title to read
+                head = self.session.head(url, timeout=HTTP_TIMEOUT, verify=False, allow_redirects=True)
+                head.close()
             except requests.exceptions.SSLError:
-                # Try HTTP if HTTPS fails
+                # Try the next scheme if this one fails
                 continue
             except Exception:
-                continue
-        
-        return None
-    
-    def _scan_ports_on_device(self, ip: str) -> List[Dict[str, str]]:
-        """Scan common web ports on a device"""
-        common_ports = [80, 443, 8080, 8000, 8443, 8888, 3000, 5000, 9090]
-        web_services = []
-        
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(self._check_web_service, ip, port): port for port in common_ports}
+                # Some embedded servers drop HEAD requests, retry with a GET below
+                head = None
+            
+            response, title = head, "No Title"
+            if head is None or head.status_code in (405, 501):
+                # Server does not implement HEAD
+                fetch = True
+            else:
+                content_type = head.headers.get('Content-Type', '').lower()
+                fetch = head.status_code == 200 and (not content_type or 'html' in content_type)
             
-            for future in as_completed(futures):
+            if fetch:
                 try:
-                    result = future.result()
-                    if result:
-                        web_services.append(result)
+                    response, title = self._fetch_page(url)
                 except Exception:
-                    pass
+                    if head is None:
+                        continue
+                    # Keep what HEAD reported when the page itself cannot be read
+            
+            # Get server header
+            server = response.headers.get('Server', 'Unknown')
+            
+            return {
+                'url': url,
+                'status': response.status_code,
+                'server': server,
+                'title': title
+            }
         
-        return web_services
+        return None
     
     def scan(self) -> List[Dict]:
         """Main scan function"""
-        print("="*80)
+        print(_EQ)
         print("NETWORK SCANNER - Device and Web Service Detection")
-        print("="*80)
+        print(_EQ)
         print(f"Local IP: {self.local_ip}")
         print(f"Network Range: {self.network_range}")
         print(f"OS: {self.os_type}")
         
+        self._alive.clear()
+        del self._ip_ints[:], self._ips[:], self._macs[:], self._vendors[:], self._web[:]
+        self._with_web = 0
+        
         # Step 1: Get devices from ARP table
         print("\n[*] Step 1: Parsing ARP table...")
         arp_devices = self._parse_arp_table()
         print(f"[+] Found {len(arp_devices)} devices in ARP table")
         
-        # Step 2: Ping sweep to find all alive hosts
-        alive_hosts = self._scan_network_range()
+        # Step 2: ARP broadcast sweep when possible, it returns MACs for free
+        arp_sweep = self._arp_sweep()
+        if arp_sweep is not None:
+            print(f"\n[+] ARP sweep of {self.network_range} found {len(arp_sweep)} hosts")
+            arp_devices.extend(arp_sweep)
+            alive_hosts = [d['ip'] for d in arp_sweep]
+            for ip in alive_hosts:
+                self._alive[ip] = True
+        else:
+            # Otherwise ping sweep to find all alive hosts
+            alive_hosts = self._scan_network_range()
         
         # Step 3: Combine results and get MAC addresses
         print("\n[*] Step 3: Resolving MAC addresses...")
         ip_mac_map = {d['ip']: d['mac'] for d in arp_devices}
         
-        all_ips = set([d['ip'] for d in arp_devices] + alive_hosts)
+        all_ips = set(ip_mac_map)
+        all_ips.update(alive_hosts)
+        
+        # The sweep has just warmed the ARP cache, so read it once for every host
+        self._arp_snapshot = self._read_arp_table_once()
         
+        missing = []
         for ip in all_ips:
             if ip not in ip_mac_map:
-                mac = self._get_mac_from_ip(ip)
-                if mac:
-                    ip_mac_map[ip] = mac
+                if ip in self._arp_snapshot:
+                    ip_mac_map[ip] = self._arp_snapshot[ip]
+                elif ip in self._mac_cache:
+                    # Resolved (or failed to resolve) on an earlier lookup
+                    if self._mac_cache[ip]:
+                        ip_mac_map[ip] = self._mac_cache[ip]
+                else:
+                    missing.append(ip)
         
-        # Step 4: Create device list with vendor info
+        # Look up the stragglers individually, in parallel
+        futures = {self.executor.submit(self._get_mac_from_ip, ip): ip for ip in missing}
+        for future in as_completed(futures):
+            ip = futures[future]
+            try:
+                mac = future.result()
+            except Exception:
+                mac = None
+            self._mac_cache[ip] = mac
+            if mac:
+                ip_mac_map[ip] = mac
+        
+        # Step 4: Create device list, vendors are filled in alongside the web scan
         print("\n[*] Step 4: Identifying vendors...")
-        for ip, mac in ip_mac_map.items():
+        for ip, mac_str in ip_mac_map.items():
+            mac = _norm_mac(mac_str)
+            if mac is None:
+                continue
             # Skip broadcast and multicast addresses
-            if mac == 'FF:FF:FF:FF:FF:FF' or mac.startswith('01:00:5E'):
+            if mac == _BROADCAST_MAC or mac.startswith(_IPV4_MULTICAST_OUI):
                 continue
             if ip.endswith('.255') or ip.startswith('224.') or ip.startswith('239.') or ip == '255.255.255.255':
                 continue
                 
-            vendor = self._identify_vendor(mac)
-            self.devices.append({
-                'ip': ip,
-                'mac': mac,
-                'vendor': vendor,
-                'web_services': []
-            })
+            self._ip_ints.append(struct.unpack('!I', socket.inet_aton(ip))[0])
+            self._ips.append(ip)
+            self._macs.append(mac)
+            self._web.append([])
         
-        # Sort by IP
-        self.devices.sort(key=lambda x: [int(p) for p in x['ip'].split('.')])
+        # Sort every column by IP
+        order = sorted(range(len(self._ips)), key=self._ip_ints.__getitem__)
+        self._ip_ints = array('I', [self._ip_ints[i] for i in order])
+        self._ips = [self._ips[i] for i in order]
+        self._macs = [self._macs[i] for i in order]
+        self._web = [self._web[i] for i in order]
+        
+        # Resolve vendors on a worker while the web scan below is in flight
+        vendor_future = self.executor.submit(self._identify_all, list(self._macs))
         
         # Step 5: Scan for web services
-        print(f"\n[*] Step 5: Scanning {len(self.devices)} devices for web services...")
+        print(f"\n[*] Step 5: Scanning {len(self._ips)} devices for web services...")
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {}
-            for device in self.devices:
-                futures[executor.submit(self._scan_ports_on_device, device['ip'])] = device
-            
-            completed = 0
-            total = len(futures)
-            
-            for future in as_completed(futures):
-                completed += 1
-                device = futures[future]
-                print(f"\r[*] Progress: {completed}/{total} devices scanned for web services", end='', flush=True)
-                
-                try:
-                    web_services = future.result()
-                    device['web_services'] = web_services
-                except Exception:
-                    pass
+        # One thread drives every TCP connect check through a selector, and each open
+        # port is handed to an HTTP probe on the shared executor as soon as it is found
+        index_of = {ip: index for index, ip in enumerate(self._ips)}
+        futures = {}
+        
+        def probe(ip: str, port: int):
+            futures[self.executor.submit(self._check_web_service, ip, port)] = index_of[ip]
+        
+        self._tcp_connect_scan([(ip, port) for ip in self._ips for port in WEB_PORTS], probe)
+        
+        if futures and self._progress_tty:
+            # Probe progress gets its own line below the finished connect checks
+            sys.stdout.write("\n")
+        for completed, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+                if result:
+                    self._web[futures[future]].append(result)
+            except Exception:
+                pass
+            self._show_progress(completed, len(futures), "open ports probed for web services")
+        
+        self._vendors = vendor_future.result()
+        self._with_web = sum(1 for web_services in self._web if web_services)
         
         print("\n")
         return self.devices
     
     def display_results(self):
         """Display scan results in a formatted table"""
-        print("\n" + "="*80)
+        print("\n" + _EQ)
         print("SCAN RESULTS")
-        print("="*80)
+        print(_EQ)
         
-        print(f"\nTotal devices found: {len(self.devices)}")
-        print(f"Devices with web services: {sum(1 for d in self.devices if d['web_services'])}")
+        print(f"\nTotal devices found: {len(self._ips)}")
+        print(f"Devices with web services: {self._with_web}")
         
-        print("\n" + "-"*80)
+        print("\n" + _DASH)
         print(f"{'IP Address':<15} {'MAC Address':<18} {'Vendor':<20} {'Web Services'}")
-        print("-"*80)
+        print(_DASH)
         
-        for device in self.devices:
-            ip = device['ip']
-            mac = device['mac']
-            vendor = device['vendor'][:19]  # Truncate long vendor names
+        for ip, mac, vendor, web_services in zip(self._ips, self._macs, self._vendors, self._web):
+            vendor = vendor[:19]  # Truncate long vendor names
             
-            web_count = len(device['web_services'])
+            web_count = len(web_services)
             web_info = f"{web_count} service(s)" if web_count > 0 else "None"
             
-            print(f"{ip:<15} {mac:<18} {vendor:<20} {web_info}")
+            print(f"{ip:<15} {_format_mac(mac):<18} {vendor:<20} {web_info}")
             
             # Display web service details
-            for service in device['web_services']:
+            for service in web_services:
                 print(f"  └─ {service['url']}")
                 print(f"     Status: {service['status']} | Server: {service['server']}")
                 print(f"     Title: {service['title']}")
         
-        print("-"*80)
+        print(_DASH)
     
     def save_results(self, filename: Optional[str] = None):
         """Save results to a text file"""
@@ -1168,41 +1686,44 @@ class NetworkScanner:
             filename = f"network_scan_{timestamp}.txt"
         
         # Save to current directory (cross-platform)
-        import os
         filepath = os.path.join(os.getcwd(), filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("NETWORK SCAN REPORT\n")
-            f.write("="*80 + "\n")
-            f.write(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Local IP: {self.local_ip}\n")
-            f.write(f"Network Range: {self.network_range}\n")
-            f.write(f"Operating System: {self.os_type}\n")
-            f.write("\n")
+        # Build the whole report in memory and write it in one go
+        parts = []
+        append = parts.append
+        
+        append(f"{_EQ}\nNETWORK SCAN REPORT\n{_EQ}\n")
+        append(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        append(f"Local IP: {self.local_ip}\n")
+        append(f"Network Range: {self.network_range}\n")
+        append(f"Operating System: {self.os_type}\n")
+        append("\n")
+        
+        append(f"Total Devices Found: {len(self._ips)}\n")
+        append(f"Devices with Web Services: {self._with_web}\n")
+        append(f"\n{_EQ}\n\n")
+        
+        devices = zip(self._ips, self._macs, self._vendors, self._web)
+        for i, (ip, mac, vendor, web_services) in enumerate(devices, 1):
+            append(f"Device #{i}\n{_DASH}\n")
+            append(f"IP Address:  {ip}\n")
+            append(f"MAC Address: {_format_mac(mac)}\n")
+            append(f"Vendor:      {vendor}\n")
+            append(f"Web Services: {len(web_services)}\n")
             
-            f.write(f"Total Devices Found: {len(self.devices)}\n")
-            f.write(f"Devices with Web Services: {sum(1 for d in self.devices if d['web_services'])}\n")
-            f.write("\n" + "="*80 + "\n\n")
+            if web_services:
+                append("\nWeb Services:\n")
+                for service in web_services:
+                    append(f"  - URL: {service['url']}\n")
+                    append(f"    Status Code: {service['status']}\n")
+                    append(f"    Server: {service['server']}\n")
+                    append(f"    Page Title: {service['title']}\n")
+                    append("\n")
             
-            for i, device in enumerate(self.devices, 1):
-                f.write(f"Device #{i}\n")
-                f.write("-"*80 + "\n")
-                f.write(f"IP Address:  {device['ip']}\n")
-                f.write(f"MAC Address: {device['mac']}\n")
-                f.write(f"Vendor:      {device['vendor']}\n")
-                f.write(f"Web Services: {len(device['web_services'])}\n")
-                
-                if device['web_services']:
-                    f.write("\nWeb Services:\n")
-                    for service in device['web_services']:
-                        f.write(f"  - URL: {service['url']}\n")
-                        f.write(f"    Status Code: {service['status']}\n")
-                        f.write(f"    Server: {service['server']}\n")
-                        f.write(f"    Page Title: {service['title']}\n")
-                        f.write("\n")
-                
-                f.write("\n")
+            append("\n")
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
         
         print(f"\n[+] Results saved to: {filepath}")
         return filepath
@@ -1210,14 +1731,10 @@ class NetworkScanner:
 
 def main():
     """Main entry point"""
-    print("\n" + "="*80)
+    print("\n" + _EQ)
     print(" "*20 + "NETWORK SCANNER v1.0")
     print(" "*15 + "Device & Web Service Discovery")
-    print("="*80)
-    
-    # Disable SSL warnings
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    print(_EQ)
     
     # Create scanner instance
     scanner = NetworkScanner()